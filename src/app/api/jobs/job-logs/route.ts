@@ -1,5 +1,12 @@
 import { NextRequest, NextResponse } from "next/server";
-import { readLogs } from "../../../../lib/logger";
+import { readLogs, ReadLogsOptions } from "../../../../lib/logger";
+
+// Parse an optional integer query parameter
+function parseIntParam(value: string | null): number | undefined {
+  if (value === null) return undefined;
+  const parsed = parseInt(value, 10);
+  return Number.isNaN(parsed) ? undefined : parsed;
+}
 
 export async function GET(request: NextRequest) {
   const url = new URL(request.url);
@@ -9,9 +16,16 @@ export async function GET(request: NextRequest) {
     return NextResponse.json({ error: 'Job ID is required' }, { status: 400 });
   }
   
+  const options: ReadLogsOptions = {
+    limit: parseIntParam(url.searchParams.get('limit')),
+    before: url.searchParams.get('before') || undefined,
+    run: url.searchParams.get('run') || undefined,
+    level: url.searchParams.get('level') || undefined,
+  };
+  
   try {
-    const logs = readLogs(jobId);
-    return NextResponse.json({ logs });
+    const { logs, nextCursor } = await readLogs(jobId, options);
+    return NextResponse.json({ logs, nextCursor });
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : String(error);
     console.error(`Error retrieving logs for job ${jobId}:`, errorMessage);
@@ -20,4 +34,4 @@ export async function GET(request: NextRequest) {
       { status: 500 }
     );
   }
-} 
\ No newline at end of file
+} 
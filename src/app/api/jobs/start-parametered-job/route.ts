@@ -1,11 +1,14 @@
 import { NextRequest, NextResponse } from "next/server";
-import { spawn } from "child_process";
+import { ChildProcess, spawn } from "child_process";
 import fs from "fs";
 import path from "path";
 
 const JOBS_FILE = path.resolve(process.cwd(), "data/jobs_parameter.json");
 const PYTHON_PATH = path.resolve(process.cwd(), "src/.venv/bin/python3");
 
+// Python process of the parameter job run currently in progress
+let runningProcess: ChildProcess | null = null;
+
 type JobType = {
   status: string;
   output?: string;
@@ -29,6 +32,16 @@ function writeJobs(jobs: Record<string, JobType>) {
 export async function POST(request: NextRequest) {
   const { selectedNodes } = await request.json();
   const jobId = "parameter-job"; // Tek bir job için sabit id
+
+  // Only one run at a time; a second request gets the status of the current run
+  if (runningProcess) {
+    const jobs = readJobs();
+    return NextResponse.json(
+      { message: "Job is already running", jobId, job: jobs[jobId] },
+      { status: 409 }
+    );
+  }
+
   const jobs = readJobs();
   jobs[jobId] = { status: "working", startedAt: Date.now() };
   writeJobs(jobs);
@@ -37,9 +50,11 @@ export async function POST(request: NextRequest) {
     "src/scripts/parameter_job.py",
     JSON.stringify(selectedNodes),
   ]);
+  runningProcess = python;
 
   let output = "";
   let error = "";
+  let finished = false;
 
   python.stdout.on("data", (data) => {
     output += data.toString();
@@ -49,7 +64,19 @@ export async function POST(request: NextRequest) {
     error += data.toString();
   });
 
+  python.on("error", (err) => {
+    if (finished) return;
+    finished = true;
+    runningProcess = null;
+    const jobs = readJobs();
+    jobs[jobId] = { status: "error", error: err.message, finishedAt: Date.now() };
+    writeJobs(jobs);
+  });
+
   python.on("close", (code) => {
+    if (finished) return;
+    finished = true;
+    runningProcess = null;
     const jobs = readJobs();
     if (code === 0) {
       jobs[jobId] = { status: "finished", output, finishedAt: Date.now() };
@@ -1,8 +1,8 @@
 import { scheduleJob } from "node-schedule";
-import { spawn } from "child_process";
+import { ChildProcess, spawn } from "child_process";
 import path from "path";
 import { v4 as uuidv4 } from "uuid";
-import { writeLog } from "../../../../lib/logger";
+import { LogLevel, flushLogs, rotateLogIfNeeded, writeLog } from "../../../../lib/logger";
 import { 
   storeJobToFile, 
   updateJobStatusInFile, 
@@ -11,10 +11,20 @@ import {
   ScheduledJobData 
 } from "../../../../lib/fileJobStore";
 
+// A run is killed after this long, so a hung script can't block later ticks forever
+const MAX_RUN_TIME_MS = 30 * 60 * 1000;
+
+interface RunningJob {
+  process: ChildProcess | null; // null while the run is still being set up
+  stop?: (reason: string) => void; // Kill the script and mark the run failed
+}
+
+// Runs currently in progress, keyed by job ID
+const runningProcesses: Record<string, RunningJob> = {};
+
 export async function startScheduledJob(cronExpression: string, scriptName: string): Promise<ScheduledJobData> {
   const jobId = uuidv4();
   const scriptPath = path.resolve(process.cwd(), `src/scripts/${scriptName}`);
-  const pythonPath = path.resolve(process.cwd(), "src/.venv/bin/python3");
   
   writeLog(jobId, 'info', `Job scheduled with cron expression: ${cronExpression} and script: ${scriptName}`);
   
@@ -28,48 +38,7 @@ export async function startScheduledJob(cronExpression: string, scriptName: stri
       return;
     }
     
-    console.log(`Job ${jobId} started`);
-    writeLog(jobId, 'info', `Job started execution`);
-    updateJobStatusInFile(jobId, 'running');
-    
-    try {
-      const logFilePath = path.resolve(process.cwd(), `logs/job-${jobId}.log`);
-      const pythonProcess = spawn(pythonPath, [
-        scriptPath,
-        "--job-id", jobId,
-        "--log-file", logFilePath,
-        "--debug"
-      ]);
-
-      pythonProcess.stdout.on("data", (data) => {
-        const output = data.toString().trim();
-        console.log(`Python script output: ${output}`);
-        writeLog(jobId, 'info', `Script output: ${output}`);
-      });
-
-      pythonProcess.stderr.on("data", (data) => {
-        const errorOutput = data.toString().trim();
-        console.error(`Python script error: ${errorOutput}`);
-        writeLog(jobId, 'error', `Script error: ${errorOutput}`);
-        updateJobStatusInFile(jobId, 'failed');
-      });
-
-      pythonProcess.on("close", (code) => {
-        console.log(`Python script exited with code ${code}`);
-        if (code === 0) {
-          writeLog(jobId, 'success', `Script completed successfully with exit code ${code}`);
-          updateJobStatusInFile(jobId, 'completed');
-        } else {
-          writeLog(jobId, 'error', `Script failed with exit code ${code}`);
-          updateJobStatusInFile(jobId, 'failed');
-        }
-      });
-    } catch (error) {
-      const errorMessage = error instanceof Error ? error.message : String(error);
-      console.error("Error starting job:", errorMessage);
-      writeLog(jobId, 'error', `Error starting job: ${errorMessage}`);
-      updateJobStatusInFile(jobId, 'failed');
-    }
+    void runJobProcess(jobId, scriptPath);
   });
   
   // Store active job in memory
@@ -99,8 +68,6 @@ export async function startScheduledJob(cronExpression: string, scriptName: stri
 
 // Function to handle job execution (used for initializing stored jobs)
 export function executeJob(jobId: string, scriptPath: string): void {
-  const pythonPath = path.resolve(process.cwd(), "src/.venv/bin/python3");
-  const logFilePath = path.resolve(process.cwd(), `logs/job-${jobId}.log`);
   // Always get fresh job data to check if job has been canceled
   const currentJobData = getJobFromFile(jobId);
   
@@ -110,8 +77,50 @@ export function executeJob(jobId: string, scriptPath: string): void {
     return;
   }
   
+  void runJobProcess(jobId, scriptPath);
+}
+
+// Check whether a run of the given job is currently in progress
+function isJobRunning(jobId: string): boolean {
+  return jobId in runningProcesses;
+}
+
+// Kill the running script of a job (if any) and free its slot, e.g. when the job is deleted
+export function stopJobProcess(jobId: string, reason: string): void {
+  const running = runningProcesses[jobId];
+  if (!running) return;
+  
+  if (running.stop) {
+    running.stop(reason);
+  } else {
+    // Still being set up; runJobProcess notices the missing slot and doesn't spawn
+    delete runningProcesses[jobId];
+  }
+}
+
+// Spawn the Python script for a job, allowing only one run per job ID.
+// Ticks that fire while a previous run is still in progress are skipped.
+async function runJobProcess(jobId: string, scriptPath: string): Promise<void> {
+  if (isJobRunning(jobId)) {
+    console.log(`Skipping tick for job ${jobId} because the previous run is still in progress`);
+    writeLog(jobId, 'info', `Skipped scheduled run: previous run is still in progress`);
+    return;
+  }
+  const slot: RunningJob = { process: null };
+  runningProcesses[jobId] = slot;
+  
+  const pythonPath = path.resolve(process.cwd(), "src/.venv/bin/python3");
+  const logFilePath = path.resolve(process.cwd(), `logs/job-${jobId}.log`);
+  
   console.log(`Job ${jobId} started`);
+  await rotateLogIfNeeded(jobId);
+  if (runningProcesses[jobId] !== slot) {
+    console.log(`Job ${jobId} was stopped before its script was started`);
+    return;
+  }
   writeLog(jobId, 'info', `Job started execution`);
+  // The script appends to the same file; the run marker must be on disk before its first line
+  await flushLogs(jobId);
   updateJobStatusInFile(jobId, 'running');
   
   try {
@@ -121,31 +130,69 @@ export function executeJob(jobId: string, scriptPath: string): void {
       "--log-file", logFilePath,
       "--debug"
     ]);
+    slot.process = pythonProcess;
+    
+    // A failed spawn can emit both 'error' and 'close', and a killed run still
+    // emits 'close'; only report the outcome once
+    let finished = false;
+    let runTimer: NodeJS.Timeout | undefined = undefined;
+    const finish = (level: LogLevel, message: string, status: ScheduledJobData['status']): boolean => {
+      if (finished) return false;
+      finished = true;
+      clearTimeout(runTimer);
+      if (runningProcesses[jobId] === slot) {
+        delete runningProcesses[jobId];
+      }
+      writeLog(jobId, level, message);
+      void flushLogs(jobId);
+      updateJobStatusInFile(jobId, status);
+      return true;
+    };
+    
+    slot.stop = (reason: string) => {
+      if (finish('error', reason, 'failed')) {
+        pythonProcess.kill();
+      }
+    };
+    
+    runTimer = setTimeout(() => {
+      console.error(`Job ${jobId} exceeded the maximum run time, killing script`);
+      slot.stop?.(`Script killed after exceeding the maximum run time of ${MAX_RUN_TIME_MS / 60000} minutes`);
+    }, MAX_RUN_TIME_MS);
 
     pythonProcess.stdout.on("data", (data) => {
       const output = data.toString().trim();
       console.log(`Python script output: ${output}`);
       writeLog(jobId, 'info', `Script output: ${output}`);
+      // Flush right away so output stays in order with the lines the script writes itself
+      void flushLogs(jobId);
     });
 
     pythonProcess.stderr.on("data", (data) => {
       const errorOutput = data.toString().trim();
       console.error(`Python script error: ${errorOutput}`);
       writeLog(jobId, 'error', `Script error: ${errorOutput}`);
+      void flushLogs(jobId);
       updateJobStatusInFile(jobId, 'failed');
     });
 
+    pythonProcess.on("error", (error) => {
+      console.error("Error starting job:", error.message);
+      finish('error', `Error starting job: ${error.message}`, 'failed');
+    });
+
     pythonProcess.on("close", (code) => {
       console.log(`Python script exited with code ${code}`);
       if (code === 0) {
-        writeLog(jobId, 'success', `Script completed successfully with exit code ${code}`);
-        updateJobStatusInFile(jobId, 'completed');
+        finish('success', `Script completed successfully with exit code ${code}`, 'completed');
       } else {
-        writeLog(jobId, 'error', `Script failed with exit code ${code}`);
-        updateJobStatusInFile(jobId, 'failed');
+        finish('error', `Script failed with exit code ${code}`, 'failed');
       }
     });
   } catch (error) {
+    if (runningProcesses[jobId] === slot) {
+      delete runningProcesses[jobId];
+    }
     const errorMessage = error instanceof Error ? error.message : String(error);
     console.error("Error starting job:", errorMessage);
     writeLog(jobId, 'error', `Error starting job: ${errorMessage}`);
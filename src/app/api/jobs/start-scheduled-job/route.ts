@@ -1,5 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
-import { startScheduledJob, executeJob } from "./cron";
+import { startScheduledJob, executeJob, stopJobProcess } from "./cron";
 import { 
   getJobFromFile, 
   getAllJobsFromFile, 
@@ -67,6 +67,9 @@ export async function DELETE(request: NextRequest) {
     return NextResponse.json({ message: "Job ID is required" }, { status: 400 });
   }
   
+  // Kill a run that is still in progress so it doesn't outlive the job
+  stopJobProcess(id, 'Job deleted; running script was killed');
+  
   const success = deleteJobFromFile(id);
   
   if (!success) {
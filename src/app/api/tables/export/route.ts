@@ -0,0 +1,63 @@
+import { NextRequest, NextResponse } from "next/server";
+import { openTableStream, TableRequestError, TableStream } from "../../utils/db";
+
+// Streams every row of a table as newline-delimited JSON
+export async function GET(request: NextRequest) {
+  const url = new URL(request.url);
+  const schema = url.searchParams.get("schema");
+  const table = url.searchParams.get("table");
+
+  if (!schema || !table) {
+    return NextResponse.json({ error: "Schema and table are required" }, { status: 400 });
+  }
+
+  let tableStream: TableStream;
+  try {
+    tableStream = await openTableStream(schema, table);
+  } catch (error) {
+    if (error instanceof TableRequestError) {
+      return NextResponse.json({ error: error.message }, { status: error.status });
+    }
+
+    console.error("Database error:", error);
+    return NextResponse.json(
+      {
+        error: "Failed to export table",
+        details: error instanceof Error ? error.message : "Unknown error",
+      },
+      { status: 500 }
+    );
+  }
+
+  const { batches, close } = tableStream;
+  const encoder = new TextEncoder();
+
+  const stream = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      try {
+        const { value, done } = await batches.next();
+        if (done) {
+          controller.close();
+          return;
+        }
+        controller.enqueue(
+          encoder.encode(value.map((row) => JSON.stringify(row)).join("\n") + "\n")
+        );
+      } catch (error) {
+        controller.error(error);
+      }
+    },
+    async cancel() {
+      // The generator may not have started yet, so close the export explicitly too
+      await batches.return(undefined);
+      await close();
+    },
+  });
+
+  return new NextResponse(stream, {
+    headers: {
+      "Content-Type": "application/x-ndjson",
+      "Content-Disposition": `attachment; filename="${schema}.${table}.ndjson"`,
+    },
+  });
+}
@@ -0,0 +1,39 @@
+import { NextRequest, NextResponse } from "next/server";
+import { getTableRows, TableRequestError } from "../../utils/db";
+
+export async function GET(request: NextRequest) {
+  const url = new URL(request.url);
+  const schema = url.searchParams.get("schema");
+  const table = url.searchParams.get("table");
+
+  if (!schema || !table) {
+    return NextResponse.json({ error: "Schema and table are required" }, { status: 400 });
+  }
+
+  const limit = parseInt(url.searchParams.get("limit") || "", 10);
+  const order = url.searchParams.get("order");
+
+  try {
+    const page = await getTableRows(schema, table, {
+      limit: Number.isNaN(limit) ? undefined : limit,
+      cursor: url.searchParams.get("cursor") || undefined,
+      sort: url.searchParams.get("sort") || undefined,
+      order: order === "desc" ? "desc" : "asc",
+      filter: url.searchParams.get("filter") || undefined,
+    });
+    return NextResponse.json(page);
+  } catch (error) {
+    if (error instanceof TableRequestError) {
+      return NextResponse.json({ error: error.message }, { status: error.status });
+    }
+
+    console.error("Database error:", error);
+    return NextResponse.json(
+      {
+        error: "Failed to fetch table rows",
+        details: error instanceof Error ? error.message : "Unknown error",
+      },
+      { status: 500 }
+    );
+  }
+}
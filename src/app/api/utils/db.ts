@@ -1,25 +1,119 @@
-import { Pool } from "pg";
+import { Client, Pool } from "pg";
 
-const pool = new Pool({
+const connectionConfig = {
   host: process.env.DB_HOST,
   port: parseInt(process.env.DB_PORT || "5432"),
   database: process.env.DB_NAME,
   user: process.env.DB_USER,
   password: process.env.DB_PASSWORD,
-});
+};
+
+const pool = new Pool(connectionConfig);
 
 export interface TableColumn {
   column_name: string;
   data_type: string;
   is_nullable: string;
+  sortable: boolean; // Whether the type has a default btree ordering
 }
 
+export type TableRow = Record<string, string | number | boolean | null>;
+
 export interface TableInfo {
   schema: string;
   table: string;
   type: string;
   columns: TableColumn[];
-  data: Record<string, string | number | boolean | null>[];
+  estimatedRows: number | null; // Planner estimate from pg_class; null for views
+}
+
+export interface TableRowsOptions {
+  limit?: number;
+  cursor?: string; // Opaque cursor returned as nextCursor by the previous page
+  sort?: string; // Column to sort by
+  order?: "asc" | "desc";
+  filter?: string; // Case-insensitive match against the whole row
+}
+
+export interface TableRowsPage {
+  rows: TableRow[];
+  nextCursor: string | null;
+}
+
+// Position after the last row of a page: the sort key and ctid for keyset
+// pagination on plain tables, or a plain offset for views and partitioned
+// tables (where ctid is missing or not unique)
+interface RowCursor {
+  key?: string | null;
+  ctid?: string;
+  offset?: number;
+}
+
+// Schema browsed by the dashboard
+const BROWSE_SCHEMA = "deneme";
+
+// Column metadata is cached for this long before information_schema is queried again
+const METADATA_TTL_MS = 60 * 1000;
+
+const DEFAULT_PAGE_SIZE = 50;
+const MAX_PAGE_SIZE = 500;
+
+// Rows fetched per round trip when streaming a whole table
+const STREAM_BATCH_SIZE = 1000;
+
+// Exports hold a connection and a read transaction (and so a table lock) for the
+// whole download, so they are capped and time out instead of waiting on a slow client
+const MAX_CONCURRENT_EXPORTS = 2;
+const EXPORT_STATEMENT_TIMEOUT_MS = 60 * 1000;
+const EXPORT_IDLE_TIMEOUT_MS = 30 * 1000;
+
+let activeExports = 0;
+
+// Raised for requests that can't be served (unknown table or column, bad cursor);
+// status is the HTTP status the API should answer with
+export class TableRequestError extends Error {
+  constructor(message: string, public status: 400 | 404 | 429) {
+    super(message);
+    this.name = "TableRequestError";
+  }
+}
+
+interface TableMetadata {
+  tables: TableInfo[];
+  relkinds: Record<string, string | null>; // pg_class.relkind keyed by "schema.table"
+}
+
+let metadataCache: { metadata: TableMetadata; expiresAt: number } | null = null;
+let metadataRequest: Promise<TableMetadata> | null = null;
+
+// Quote an identifier for use in SQL
+function quoteIdent(identifier: string): string {
+  return `"${identifier.replace(/"/g, '""')}"`;
+}
+
+function encodeCursor(cursor: RowCursor): string {
+  return Buffer.from(JSON.stringify(cursor)).toString("base64url");
+}
+
+function decodeCursor(cursor: string): RowCursor {
+  let decoded: RowCursor;
+  try {
+    decoded = JSON.parse(Buffer.from(cursor, "base64url").toString("utf8"));
+  } catch {
+    throw new TableRequestError("Invalid cursor", 400);
+  }
+
+  const valid =
+    typeof decoded === "object" &&
+    decoded !== null &&
+    (decoded.ctid === undefined || /^\(\d+,\d+\)$/.test(decoded.ctid)) &&
+    (decoded.offset === undefined || (Number.isInteger(decoded.offset) && decoded.offset >= 0)) &&
+    (decoded.key === undefined || decoded.key === null || typeof decoded.key === "string");
+  if (!valid) {
+    throw new TableRequestError("Invalid cursor", 400);
+  }
+
+  return decoded;
 }
 
 interface TableListItem {
@@ -55,59 +149,312 @@ export async function getTableList(): Promise<TableListItem[]> {
   }
 }
 
-export async function getTableDetails(): Promise<TableInfo[]> {
-  try {
-    // Get all tables and views
-    const tablesQuery = `
-      SELECT table_schema, table_name, table_type
-      FROM information_schema.tables 
-      WHERE table_schema = 'deneme'
-      AND table_type IN ('BASE TABLE', 'VIEW')
-      ORDER BY table_schema, table_name;
-    `;
+async function fetchTableMetadata(): Promise<TableMetadata> {
+  // Tables, their columns and row estimates in a single round trip. A column is
+  // sortable when its (base) type has a default btree operator class, either
+  // directly, through a binary-coercible type (e.g. varchar -> text), or through
+  // the polymorphic class that covers it (arrays, enums, ranges, composites).
+  const query = `
+    SELECT
+      t.table_schema,
+      t.table_name,
+      t.table_type,
+      c.relkind,
+      CASE WHEN c.relkind IN ('r', 'p', 'm') THEN c.reltuples::bigint END AS estimated_rows,
+      COALESCE(
+        json_agg(
+          json_build_object(
+            'column_name', col.column_name,
+            'data_type', col.data_type,
+            'is_nullable', col.is_nullable,
+            'sortable', COALESCE(ord.sortable, false)
+          ) ORDER BY col.ordinal_position
+        ) FILTER (WHERE col.column_name IS NOT NULL),
+        '[]'
+      ) AS columns
+    FROM information_schema.tables t
+    LEFT JOIN information_schema.columns col
+      ON col.table_schema = t.table_schema AND col.table_name = t.table_name
+    LEFT JOIN pg_catalog.pg_namespace n ON n.nspname = t.table_schema
+    LEFT JOIN pg_catalog.pg_class c ON c.relnamespace = n.oid AND c.relname = t.table_name
+    LEFT JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attname = col.column_name
+    LEFT JOIN pg_catalog.pg_type ty ON ty.oid = a.atttypid
+    LEFT JOIN pg_catalog.pg_type bt
+      ON bt.oid = CASE WHEN ty.typtype = 'd' THEN ty.typbasetype ELSE ty.oid END
+    LEFT JOIN LATERAL (
+      SELECT EXISTS (
+        SELECT 1
+        FROM pg_catalog.pg_opclass oc
+        JOIN pg_catalog.pg_am am ON am.oid = oc.opcmethod
+        WHERE am.amname = 'btree'
+        AND oc.opcdefault
+        AND (
+          oc.opcintype = bt.oid
+          OR oc.opcintype = CASE
+            WHEN bt.typcategory = 'A' THEN to_regtype('anyarray')
+            WHEN bt.typtype = 'e' THEN to_regtype('anyenum')
+            WHEN bt.typtype = 'r' THEN to_regtype('anyrange')
+            WHEN bt.typtype = 'm' THEN to_regtype('anymultirange')
+            WHEN bt.typtype = 'c' THEN to_regtype('record')
+          END
+          OR EXISTS (
+            SELECT 1
+            FROM pg_catalog.pg_cast pc
+            WHERE pc.castsource = bt.oid
+            AND pc.casttarget = oc.opcintype
+            AND pc.castmethod = 'b'
+          )
+        )
+      ) AS sortable
+    ) ord ON true
+    WHERE t.table_schema = $1
+    AND t.table_type IN ('BASE TABLE', 'VIEW')
+    GROUP BY t.table_schema, t.table_name, t.table_type, c.relkind, c.reltuples
+    ORDER BY t.table_schema, t.table_name;
+  `;
+
+  const result = await pool.query(query, [BROWSE_SCHEMA]);
+
+  const relkinds: Record<string, string | null> = {};
+  const tables = result.rows.map((row) => {
+    relkinds[`${row.table_schema}.${row.table_name}`] = row.relkind;
+    return {
+      schema: row.table_schema,
+      table: row.table_name,
+      type: row.table_type,
+      columns: row.columns,
+      // reltuples is -1 for tables that have never been analyzed
+      estimatedRows:
+        row.estimated_rows === null || Number(row.estimated_rows) < 0
+          ? null
+          : Number(row.estimated_rows),
+    };
+  });
+
+  return { tables, relkinds };
+}
 
-    const tables = await pool.query(tablesQuery);
-
-    // Get details for each table/view
-    const tableDetails = await Promise.all(
-      tables.rows.map(async (table) => {
-        // Get columns
-        const columnsQuery = `
-          SELECT column_name, data_type, is_nullable
-          FROM information_schema.columns
-          WHERE table_schema = $1 AND table_name = $2
-          ORDER BY ordinal_position;
-        `;
-        const columns = await pool.query(columnsQuery, [
-          table.table_schema,
-          table.table_name,
-        ]);
-
-        // Get data
-        const dataQuery = `
-          SELECT *
-          FROM "${table.table_schema}"."${table.table_name}"
-          ;
-        `;
-        const data = await pool.query(dataQuery);
-
-        return {
-          schema: table.table_schema,
-          table: table.table_name,
-          type: table.table_type,
-          columns: columns.rows,
-          data: data.rows,
-        };
+// Get the table metadata, served from cache while it is fresh
+async function getTableMetadata(): Promise<TableMetadata> {
+  if (metadataCache && metadataCache.expiresAt > Date.now()) {
+    return metadataCache.metadata;
+  }
+
+  // Share one in-flight query between concurrent callers
+  if (!metadataRequest) {
+    metadataRequest = fetchTableMetadata()
+      .then((metadata) => {
+        metadataCache = { metadata, expiresAt: Date.now() + METADATA_TTL_MS };
+        return metadata;
       })
-    );
+      .finally(() => {
+        metadataRequest = null;
+      });
+  }
+
+  return metadataRequest;
+}
 
-    return tableDetails;
+// Get tables and views with their columns, served from cache while it is fresh
+export async function getTableDetails(): Promise<TableInfo[]> {
+  try {
+    const { tables } = await getTableMetadata();
+    return tables;
   } catch (error) {
     console.error("Error fetching table details:", error);
     throw error;
   }
 }
 
+// Look up a browsable table; only known tables and columns are ever interpolated into SQL
+async function findTable(
+  schema: string,
+  table: string
+): Promise<{ tableInfo: TableInfo; relkind: string | null }> {
+  const { tables, relkinds } = await getTableMetadata();
+  const tableInfo = tables.find((t) => t.schema === schema && t.table === table);
+  if (!tableInfo) {
+    throw new TableRequestError(`Table ${schema}.${table} not found`, 404);
+  }
+  return { tableInfo, relkind: relkinds[`${schema}.${table}`] ?? null };
+}
+
+// Get one page of rows from a table or view
+export async function getTableRows(
+  schema: string,
+  table: string,
+  options: TableRowsOptions = {}
+): Promise<TableRowsPage> {
+  const { tableInfo, relkind } = await findTable(schema, table);
+  // Only plain tables have a unique ctid to page on; partitions can repeat ctids
+  const offsetPaged = tableInfo.type === "VIEW" || relkind !== "r";
+  const limit = Math.min(Math.max(options.limit ?? DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE);
+  const cursor = options.cursor ? decodeCursor(options.cursor) : null;
+
+  let sortColumn: string | null = null;
+  if (options.sort) {
+    const column = tableInfo.columns.find((c) => c.column_name === options.sort);
+    if (!column) {
+      throw new TableRequestError(`Unknown column ${options.sort}`, 400);
+    }
+    if (!column.sortable) {
+      throw new TableRequestError(`Column ${options.sort} can't be sorted`, 400);
+    }
+    sortColumn = quoteIdent(column.column_name);
+  }
+  const descending = options.order === "desc";
+
+  const params: (string | number)[] = [];
+  const conditions: string[] = [];
+
+  if (options.filter) {
+    params.push(`%${options.filter.replace(/[\\%_]/g, "\\$&")}%`);
+    conditions.push(`t::text ILIKE $${params.length}`);
+  }
+
+  const selectList = ["t.*"];
+  const orderBy: string[] = [];
+
+  if (!offsetPaged) {
+    // Keyset pagination on (sort column, ctid); NULLs always sort last
+    selectList.push("t.ctid::text AS __ctid");
+    if (sortColumn) {
+      selectList.push(`t.${sortColumn}::text AS __sort_key`);
+      orderBy.push(`t.${sortColumn} ${descending ? "DESC" : "ASC"} NULLS LAST`);
+    }
+    orderBy.push("t.ctid");
+
+    if (cursor?.ctid) {
+      params.push(cursor.ctid);
+      const ctidParam = `$${params.length}`;
+
+      if (!sortColumn) {
+        conditions.push(`t.ctid > ${ctidParam}::tid`);
+      } else if (cursor.key === null || cursor.key === undefined) {
+        conditions.push(`(t.${sortColumn} IS NULL AND t.ctid > ${ctidParam}::tid)`);
+      } else {
+        params.push(cursor.key);
+        const keyParam = `$${params.length}`;
+        conditions.push(
+          `(t.${sortColumn} ${descending ? "<" : ">"} ${keyParam}` +
+            ` OR (t.${sortColumn} = ${keyParam} AND t.ctid > ${ctidParam}::tid)` +
+            ` OR t.${sortColumn} IS NULL)`
+        );
+      }
+    }
+  } else {
+    // Offset paging needs a total order; the whole-row text breaks every tie
+    if (sortColumn) {
+      orderBy.push(`t.${sortColumn} ${descending ? "DESC" : "ASC"} NULLS LAST`);
+    }
+    orderBy.push("t::text");
+  }
+
+  params.push(limit + 1);
+  let query = `
+    SELECT ${selectList.join(", ")}
+    FROM ${quoteIdent(schema)}.${quoteIdent(table)} t
+    ${conditions.length > 0 ? `WHERE ${conditions.join(" AND ")}` : ""}
+    ${orderBy.length > 0 ? `ORDER BY ${orderBy.join(", ")}` : ""}
+    LIMIT $${params.length}
+  `;
+
+  const offset = offsetPaged ? cursor?.offset ?? 0 : 0;
+  if (offsetPaged) {
+    params.push(offset);
+    query += ` OFFSET $${params.length}`;
+  }
+
+  try {
+    const result = await pool.query(query, params);
+    const hasMore = result.rows.length > limit;
+    const pageRows = result.rows.slice(0, limit);
+
+    let nextCursor: string | null = null;
+    if (hasMore) {
+      const lastRow = pageRows[pageRows.length - 1];
+      nextCursor = offsetPaged
+        ? encodeCursor({ offset: offset + limit })
+        : encodeCursor({ key: sortColumn ? lastRow.__sort_key : undefined, ctid: lastRow.__ctid });
+    }
+
+    const rows = pageRows.map((row) => {
+      // eslint-disable-next-line @typescript-eslint/no-unused-vars
+      const { __ctid, __sort_key, ...rest } = row;
+      return rest as TableRow;
+    });
+
+    return { rows, nextCursor };
+  } catch (error) {
+    console.error(`Error fetching rows for ${schema}.${table}:`, error);
+    throw error;
+  }
+}
+
+export interface TableStream {
+  batches: AsyncGenerator<TableRow[]>;
+  close: () => Promise<void>; // Ends the export; safe to call more than once
+}
+
+// Open a server-side cursor over all rows of a table or view. The table is
+// checked and the cursor declared up front, so errors surface before streaming.
+export async function openTableStream(schema: string, table: string): Promise<TableStream> {
+  await findTable(schema, table);
+
+  if (activeExports >= MAX_CONCURRENT_EXPORTS) {
+    throw new TableRequestError("Too many exports in progress, try again later", 429);
+  }
+  activeExports++;
+
+  // A dedicated connection, so a slow download never holds one from the pool
+  const client = new Client(connectionConfig);
+  client.on("error", (error) => {
+    console.error(`Export connection for ${schema}.${table} failed:`, error);
+  });
+
+  let closed = false;
+  const close = async () => {
+    if (closed) return;
+    closed = true;
+    activeExports--;
+    // Ending the connection also ends the transaction and releases its lock
+    await client.end().catch(() => undefined);
+  };
+
+  try {
+    await client.connect();
+    await client.query("BEGIN READ ONLY");
+    await client.query(`SET LOCAL statement_timeout = ${EXPORT_STATEMENT_TIMEOUT_MS}`);
+    await client.query(`SET LOCAL idle_in_transaction_session_timeout = ${EXPORT_IDLE_TIMEOUT_MS}`);
+    await client.query(
+      `DECLARE table_stream NO SCROLL CURSOR FOR SELECT * FROM ${quoteIdent(schema)}.${quoteIdent(table)}`
+    );
+  } catch (error) {
+    await close();
+    console.error(`Error opening row stream for ${schema}.${table}:`, error);
+    throw error;
+  }
+
+  async function* readBatches(): AsyncGenerator<TableRow[]> {
+    try {
+      while (true) {
+        const batch = await client.query(`FETCH ${STREAM_BATCH_SIZE} FROM table_stream`);
+        if (batch.rows.length === 0) break;
+        yield batch.rows;
+      }
+      await client.query("COMMIT");
+    } catch (error) {
+      console.error(`Error streaming rows for ${schema}.${table}:`, error);
+      throw error;
+    } finally {
+      // Also reached when the consumer stops early (e.g. the client disconnected)
+      await close();
+    }
+  }
+
+  return { batches: readBatches(), close };
+}
+
 // Cleanup function for graceful shutdown
 export async function closePool() {
   await pool.end();
@@ -1,10 +1,10 @@
 'use client';
 
 import { useState, useEffect } from 'react';
-import { useQuery } from '@tanstack/react-query';
+import { useInfiniteQuery } from '@tanstack/react-query';
 import { Button } from '../../../components/ui/button';
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from '../../../components/ui/dialog';
-import { LogEntry } from '../../../lib/logger';
+import { LogPage } from '../../../lib/logger';
 import { ScrollArea } from '../../../components/ui/scroll-area';
 
 interface JobLogViewerProps {
@@ -12,33 +12,44 @@ interface JobLogViewerProps {
   buttonLabel?: string;
 }
 
-// Function to fetch job logs
-const fetchJobLogs = async (jobId: string): Promise<LogEntry[]> => {
-  const response = await fetch(`/api/jobs/job-logs?jobId=${jobId}`);
+// Function to fetch a page of job logs, newest first
+const fetchJobLogs = async (jobId: string, before?: string): Promise<LogPage> => {
+  const params = new URLSearchParams({ jobId });
+  if (before) {
+    params.set('before', before);
+  }
+  
+  const response = await fetch(`/api/jobs/job-logs?${params}`);
   
   if (!response.ok) {
     throw new Error('Failed to fetch logs');
   }
   
-  const data = await response.json();
-  return data.logs;
+  return response.json();
 };
 
 export function JobLogViewer({ jobId, buttonLabel = 'View Logs' }: JobLogViewerProps) {
   const [isOpen, setIsOpen] = useState(false);
   
-  // Query to fetch job logs
+  // Query to fetch job logs, one page at a time
   const { 
-    data: logs,
+    data,
     isLoading,
     error,
-    refetch
-  } = useQuery({
+    refetch,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage
+  } = useInfiniteQuery({
     queryKey: ['jobLogs', jobId],
-    queryFn: () => fetchJobLogs(jobId),
+    queryFn: ({ pageParam }) => fetchJobLogs(jobId, pageParam),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor ?? undefined,
     enabled: false, // Don't fetch automatically
   });
   
+  const logs = data?.pages.flatMap((page) => page.logs);
+  
   // Fetch logs when the dialog is opened
   useEffect(() => {
     if (isOpen) {
@@ -87,7 +98,7 @@ export function JobLogViewer({ jobId, buttonLabel = 'View Logs' }: JobLogViewerP
             <div className="space-y-2 font-mono text-sm">
               {logs.map((log, index) => (
                 <div 
-                  key={index} 
+                  key={log.id ?? index} 
                   className="border p-2 rounded-sm"
                 >
                   <div className="flex justify-between">
@@ -99,6 +110,18 @@ export function JobLogViewer({ jobId, buttonLabel = 'View Logs' }: JobLogViewerP
                   <div className="mt-1 whitespace-pre-wrap">{log.message}</div>
                 </div>
               ))}
+              {hasNextPage && (
+                <div className="flex justify-center py-2">
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    onClick={() => fetchNextPage()}
+                    disabled={isFetchingNextPage}
+                  >
+                    {isFetchingNextPage ? 'Loading...' : 'Load older logs'}
+                  </Button>
+                </div>
+              )}
             </div>
           ) : (
             <div className="py-4 text-center">No logs found for this job</div>
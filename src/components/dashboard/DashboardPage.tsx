@@ -24,7 +24,6 @@ export default function DashboardPage() {
 
   const debouncedTableSearch = useDebounce(tableSearch, 500);
   const debouncedFilters = useDebounce(filters, 50);
-  const debouncedDataFilters = useDebounce(dataFilters, 50);
 
   useEffect(() => {
     async function fetchTables() {
@@ -115,15 +114,15 @@ export default function DashboardPage() {
           <div className="h-full w-full">
             {filteredTables.length > 0 ? (
               <div className="space-y-6">
-                {filteredTables.map((tableInfo, index) => {
+                {filteredTables.map((tableInfo) => {
                   const tableKey = `${tableInfo.schema}.${tableInfo.table}`;
                   return (
                     <TableCard
-                      key={index}
+                      key={tableKey}
                       tableInfo={tableInfo}
                       selectedColumns={selectedColumns[tableKey] || []}
                       columnFilter={debouncedFilters[tableKey] || ""}
-                      dataFilter={debouncedDataFilters[tableKey] || ""}
+                      dataFilter={dataFilters[tableKey] || ""}
                       onColumnFilterChange={(value) =>
                         handleFilterChange(tableKey, value)
                       }
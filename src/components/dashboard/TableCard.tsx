@@ -1,8 +1,13 @@
+import { useState } from "react";
+import { useInfiniteQuery } from "@tanstack/react-query";
+import { ArrowDown, ArrowUp } from "lucide-react";
 import { Card, CardHeader, CardTitle } from "../../components/ui/card";
 import { Input } from "../../components/ui/input";
+import { Button } from "../../components/ui/button";
 import { Checkbox } from "../../components/ui/checkbox";
 import { Label } from "../../components/ui/label";
-import { TableColumn, TableInfo } from "../../app/api/utils/db";
+import { useDebounce } from "../../hooks/useDebounce";
+import { TableColumn, TableInfo, TableRowsPage } from "../../app/api/utils/db";
 
 interface TableCardProps {
   tableInfo: TableInfo;
@@ -14,6 +19,39 @@ interface TableCardProps {
   onColumnSelection: (columnName: string, checked: boolean) => void;
 }
 
+type SortState = {
+  column: string;
+  order: "asc" | "desc";
+} | null;
+
+// Fetch one page of rows for a table from the server
+const fetchTableRows = async (
+  tableInfo: TableInfo,
+  sort: SortState,
+  filter: string,
+  cursor?: string
+): Promise<TableRowsPage> => {
+  const params = new URLSearchParams({
+    schema: tableInfo.schema,
+    table: tableInfo.table,
+  });
+  if (sort) {
+    params.set("sort", sort.column);
+    params.set("order", sort.order);
+  }
+  if (filter) params.set("filter", filter);
+  if (cursor) params.set("cursor", cursor);
+
+  const response = await fetch(`/api/tables/rows?${params}`);
+  const data = await response.json();
+
+  if (!response.ok) {
+    throw new Error(data.details || data.error || "Failed to fetch rows");
+  }
+
+  return data;
+};
+
 export function TableCard({
   tableInfo,
   selectedColumns,
@@ -24,6 +62,39 @@ export function TableCard({
   onColumnSelection,
 }: TableCardProps) {
   const tableKey = `${tableInfo.schema}.${tableInfo.table}`;
+  const [sort, setSort] = useState<SortState>(null);
+  const [showRows, setShowRows] = useState(false);
+
+  // The filter runs as a full scan on the server, so wait until typing stops
+  const debouncedDataFilter = useDebounce(dataFilter, 500);
+
+  // Rows are loaded page by page once the card is opened;
+  // sorting and data filtering happen on the server
+  const {
+    data,
+    error,
+    isLoading,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: ["tableRows", tableKey, sort, debouncedDataFilter],
+    queryFn: ({ pageParam }) => fetchTableRows(tableInfo, sort, debouncedDataFilter, pageParam),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor ?? undefined,
+    enabled: showRows,
+  });
+
+  const rows = showRows ? data?.pages.flatMap((page) => page.rows) ?? [] : [];
+
+  // Cycle a column through ascending, descending and unsorted
+  const handleSort = (columnName: string) => {
+    setSort((prev) => {
+      if (!prev || prev.column !== columnName) return { column: columnName, order: "asc" };
+      if (prev.order === "asc") return { column: columnName, order: "desc" };
+      return null;
+    });
+  };
 
   const filterColumns = (columns: TableColumn[], filter: string) => {
     if (!filter) return columns;
@@ -34,15 +105,6 @@ export function TableCard({
     );
   };
 
-  const filterData = (data: Record<string, string | number | boolean | null>[], filter: string) => {
-    if (!filter) return data;
-    return data.filter((row) =>
-      Object.values(row).some((value) =>
-        String(value).toLowerCase().includes(filter)
-      )
-    );
-  };
-
   return (
     <Card className="overflow-hidden border-2">
       <CardHeader className="bg-muted/30 border-b-2">
@@ -51,6 +113,11 @@ export function TableCard({
           <span className="ml-2 text-sm text-muted-foreground">
             ({tableInfo.type === 'VIEW' ? 'View' : 'Table'})
           </span>
+          {tableInfo.estimatedRows !== null && (
+            <span className="ml-2 text-sm text-muted-foreground">
+              ~{tableInfo.estimatedRows.toLocaleString()} rows
+            </span>
+          )}
         </CardTitle>
       </CardHeader>
       <div className="p-6">
@@ -121,9 +188,18 @@ export function TableCard({
           <div className="col-span-9">
             <div className="flex flex-col gap-4">
               <div>
-                <h3 className="text-sm font-medium text-muted-foreground mb-2">
-                  Data
-                </h3>
+                <div className="flex items-center justify-between mb-2">
+                  <h3 className="text-sm font-medium text-muted-foreground">
+                    Data
+                  </h3>
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    onClick={() => setShowRows((prev) => !prev)}
+                  >
+                    {showRows ? "Hide rows" : "Show rows"}
+                  </Button>
+                </div>
                 <Input
                   placeholder="Filter data..."
                   value={dataFilter}
@@ -145,15 +221,24 @@ export function TableCard({
                           .map((column: TableColumn, colIndex: number) => (
                             <th
                               key={colIndex}
-                              className="px-4 py-2 text-left text-xs font-medium text-muted-foreground whitespace-nowrap sticky top-0 bg-muted/50"
+                              onClick={() => column.sortable && handleSort(column.column_name)}
+                              className={`px-4 py-2 text-left text-xs font-medium text-muted-foreground whitespace-nowrap sticky top-0 bg-muted/50 ${column.sortable ? "cursor-pointer select-none" : ""}`}
                             >
-                              {column.column_name}
+                              <span className="inline-flex items-center gap-1">
+                                {column.column_name}
+                                {sort?.column === column.column_name &&
+                                  (sort.order === "asc" ? (
+                                    <ArrowUp className="h-3 w-3" />
+                                  ) : (
+                                    <ArrowDown className="h-3 w-3" />
+                                  ))}
+                              </span>
                             </th>
                           ))}
                       </tr>
                     </thead>
                     <tbody className="divide-y divide-border">
-                      {filterData(tableInfo.data, dataFilter).map((row, rowIndex) => (
+                      {rows.map((row, rowIndex) => (
                         <tr
                           key={rowIndex}
                           className="hover:bg-muted/50 transition-colors"
@@ -176,6 +261,35 @@ export function TableCard({
                       ))}
                     </tbody>
                   </table>
+                  {!showRows ? (
+                    <div className="py-4 text-center text-sm text-muted-foreground">
+                      Click &quot;Show rows&quot; to load data
+                    </div>
+                  ) : isLoading ? (
+                    <div className="py-4 text-center text-sm text-muted-foreground">
+                      Loading rows...
+                    </div>
+                  ) : error ? (
+                    <div className="py-4 text-center text-sm text-destructive">
+                      {error instanceof Error ? error.message : "Failed to fetch rows"}
+                    </div>
+                  ) : rows.length === 0 ? (
+                    <div className="py-4 text-center text-sm text-muted-foreground">
+                      No rows found
+                    </div>
+                  ) : null}
+                  {showRows && hasNextPage && (
+                    <div className="flex justify-center py-2">
+                      <Button
+                        variant="outline"
+                        size="sm"
+                        onClick={() => fetchNextPage()}
+                        disabled={isFetchingNextPage}
+                      >
+                        {isFetchingNextPage ? "Loading..." : "Load more"}
+                      </Button>
+                    </div>
+                  )}
                 </div>
               </div>
             </div>
@@ -5,6 +5,25 @@ import { format } from 'date-fns';
 // Base directory for all job logs
 const LOG_DIR = path.join(process.cwd(), 'logs');
 
+// Buffered writes are flushed to disk after this delay
+const FLUSH_INTERVAL_MS = 200;
+
+// A job log is rotated into a numbered segment once it grows past this size
+const MAX_LOG_FILE_SIZE = 5 * 1024 * 1024;
+
+// Number of rotated segments kept per job (job-<id>.1.log is the newest)
+const MAX_LOG_SEGMENTS = 5;
+
+// Page size used by readLogs when no limit is given, and the upper bound for it
+const DEFAULT_PAGE_SIZE = 200;
+const MAX_PAGE_SIZE = 1000;
+
+// A page is read from a file with a single read when its lines span at most this many bytes
+const MAX_RANGE_READ_SIZE = 1024 * 1024;
+
+// Message written by the scheduler at the start of every run; used to split a log into runs
+const RUN_START_MESSAGE = 'Job started execution';
+
 // Ensure log directory exists
 if (!fs.existsSync(LOG_DIR)) {
   fs.mkdirSync(LOG_DIR, { recursive: true });
@@ -18,14 +37,62 @@ export interface LogEntry {
   timestamp: string;
   level: LogLevel;
   message: string;
+  id?: string; // Position of the entry ("<file inode>:<line>"), usable as a paging cursor
+  run?: string; // Run the entry belongs to ("<file inode>:<run number>", 0 = before the first run)
+}
+
+// Options for reading a page of logs
+export interface ReadLogsOptions {
+  limit?: number; // Maximum number of entries to return
+  before?: string; // Only return entries older than this cursor (an entry id)
+  run?: string; // Only return entries of this run (a run id, or 'latest')
+  level?: string; // Only return entries with this level
+}
+
+// A page of log entries, newest first
+export interface LogPage {
+  logs: LogEntry[];
+  nextCursor: string | null; // Pass as `before` to fetch older entries
+}
+
+// Line-offset index of a log file, extended incrementally as the file grows
+interface LogIndex {
+  ino: number; // Inode of the indexed file, to notice when the path points to a new file
+  size: number; // Bytes indexed so far (always ends on a line boundary)
+  offsets: number[]; // Byte offset of each line
+  levels: string[]; // Level of each line
+  runs: number[]; // Run number of each line
+  runCount: number;
+}
+
+// Pending log lines per job, written out by the next flush
+const pendingWrites: Record<string, string[]> = {};
+
+// In-flight flush per job, so writes to the same file stay ordered
+const activeFlushes: Record<string, Promise<void>> = {};
+
+// A log file of a job: the current file or one of its rotated segments
+interface LogFile {
+  path: string;
+  stat: fs.Stats;
 }
 
+// Cached line-offset indexes keyed by log file path
+const logIndexes: Record<string, LogIndex> = {};
+
+let flushTimer: NodeJS.Timeout | null = null;
+
 // Get the log file path for a specific job
 export function getLogFilePath(jobId: string): string {
   return path.join(LOG_DIR, `job-${jobId}.log`);
 }
 
-// Write log entry to a file
+// Get the path of a rotated log segment for a specific job
+function getLogSegmentPath(jobId: string, segment: number): string {
+  return path.join(LOG_DIR, `job-${jobId}.${segment}.log`);
+}
+
+// Queue a log entry; entries are appended to the file asynchronously in batches
 export function writeLog(jobId: string, level: LogLevel, message: string): void {
   const timestamp = format(new Date(), 'yyyy-MM-dd HH:mm:ss');
   const logEntry: LogEntry = {
@@ -33,35 +100,275 @@ export function writeLog(jobId: string, level: LogLevel, message: string): void
     level,
     message
   };
-  
-  const logFilePath = getLogFilePath(jobId);
-  
-  // Write to file
-  fs.appendFileSync(
-    logFilePath, 
-    JSON.stringify(logEntry) + '\n', 
-    { encoding: 'utf8' }
-  );
+
+  if (!pendingWrites[jobId]) {
+    pendingWrites[jobId] = [];
+  }
+  pendingWrites[jobId].push(JSON.stringify(logEntry) + '\n');
+
+  if (!flushTimer) {
+    flushTimer = setTimeout(() => {
+      flushTimer = null;
+      void flushLogs();
+    }, FLUSH_INTERVAL_MS);
+  }
+}
+
+// Write all pending log entries (for one job, or for every job) to disk
+export async function flushLogs(jobId?: string): Promise<void> {
+  const jobIds = jobId ? [jobId] : Object.keys(pendingWrites);
+  await Promise.all(jobIds.map(flushJobLogs));
+}
+
+function flushJobLogs(jobId: string): Promise<void> {
+  const previousFlush = activeFlushes[jobId] ?? Promise.resolve();
+
+  const flush = previousFlush.then(async () => {
+    const lines = pendingWrites[jobId];
+    if (!lines || lines.length === 0) return;
+    delete pendingWrites[jobId];
+
+    try {
+      await fs.promises.appendFile(getLogFilePath(jobId), lines.join(''), { encoding: 'utf8' });
+    } catch (error) {
+      console.error(`Error writing logs for job ${jobId}:`, error);
+    }
+  });
+
+  activeFlushes[jobId] = flush;
+  flush.finally(() => {
+    if (activeFlushes[jobId] === flush) {
+      delete activeFlushes[jobId];
+    }
+  });
+
+  return flush;
 }
 
-// Read logs for a specific job
-export function readLogs(jobId: string): LogEntry[] {
+// Rotate the job log into numbered segments once it is larger than MAX_LOG_FILE_SIZE.
+// Called before a run starts, so a single run never spans two files.
+export async function rotateLogIfNeeded(jobId: string): Promise<void> {
   const logFilePath = getLogFilePath(jobId);
-  
-  if (!fs.existsSync(logFilePath)) {
-    return [];
+
+  // Make sure lines of the previous run end up in the file being rotated
+  await flushLogs(jobId);
+
+  try {
+    if (!fs.existsSync(logFilePath) || fs.statSync(logFilePath).size < MAX_LOG_FILE_SIZE) {
+      return;
+    }
+
+    const oldestSegment = getLogSegmentPath(jobId, MAX_LOG_SEGMENTS);
+    if (fs.existsSync(oldestSegment)) {
+      fs.unlinkSync(oldestSegment);
+    }
+
+    for (let segment = MAX_LOG_SEGMENTS - 1; segment >= 1; segment--) {
+      const segmentPath = getLogSegmentPath(jobId, segment);
+      if (fs.existsSync(segmentPath)) {
+        fs.renameSync(segmentPath, getLogSegmentPath(jobId, segment + 1));
+      }
+    }
+
+    fs.renameSync(logFilePath, getLogSegmentPath(jobId, 1));
+  } catch (error) {
+    console.error(`Error rotating logs for job ${jobId}:`, error);
+  }
+}
+
+// Get the existing log files of a job, newest first
+function getLogFiles(jobId: string): LogFile[] {
+  const paths = [getLogFilePath(jobId)];
+  for (let segment = 1; segment <= MAX_LOG_SEGMENTS; segment++) {
+    paths.push(getLogSegmentPath(jobId, segment));
   }
-  
+
+  return paths
+    .filter((filePath) => fs.existsSync(filePath))
+    .map((filePath) => ({ path: filePath, stat: fs.statSync(filePath) }));
+}
+
+// Split an "<inode>:<number>" id into its parts
+function parsePositionId(id: string): { ino: number; position: number } | null {
+  const [ino, position] = id.split(':').map(Number);
+  if (!Number.isInteger(ino) || !Number.isInteger(position)) {
+    return null;
+  }
+  return { ino, position };
+}
+
+// Parse a single log line; lines that are not JSON are kept as plain info messages
+function parseLogLine(line: string): LogEntry {
+  try {
+    return JSON.parse(line) as LogEntry;
+  } catch {
+    return { timestamp: '', level: 'info', message: line };
+  }
+}
+
+// Bring the line-offset index of a log file up to date, reading only bytes added since the last call
+function updateLogIndex(logFile: LogFile): LogIndex {
+  const logFilePath = logFile.path;
+  const { ino, size } = logFile.stat;
+  let index = logIndexes[logFilePath];
+
+  // Start over if the file is new to us, was rotated/replaced, or was truncated
+  if (!index || index.ino !== ino || size < index.size) {
+    index = { ino, size: 0, offsets: [], levels: [], runs: [], runCount: 0 };
+    logIndexes[logFilePath] = index;
+  }
+
+  if (size === index.size) {
+    return index;
+  }
+
+  const buffer = Buffer.alloc(size - index.size);
+  const fd = fs.openSync(logFilePath, 'r');
   try {
-    const fileContent = fs.readFileSync(logFilePath, { encoding: 'utf8' });
-    
-    return fileContent
-      .split('\n')
-      .filter(line => line.trim() !== '')
-      .map(line => JSON.parse(line) as LogEntry)
-      .reverse(); // Reverse order to show newest logs first
+    fs.readSync(fd, buffer, 0, buffer.length, index.size);
+  } finally {
+    fs.closeSync(fd);
+  }
+
+  let lineStart = 0;
+  let newline = buffer.indexOf(0x0a, lineStart);
+
+  // Only complete lines are indexed; a partially written last line is picked up next time
+  while (newline !== -1) {
+    const line = buffer.toString('utf8', lineStart, newline);
+
+    if (line.trim() !== '') {
+      const entry = parseLogLine(line);
+      if (entry.message === RUN_START_MESSAGE) {
+        index.runCount++;
+      }
+      index.offsets.push(index.size + lineStart);
+      index.levels.push(entry.level);
+      index.runs.push(index.runCount);
+    }
+
+    lineStart = newline + 1;
+    newline = buffer.indexOf(0x0a, lineStart);
+  }
+
+  index.size += lineStart;
+  return index;
+}
+
+// Read a page of logs for a specific job, newest first.
+// Without options this returns the tail of the current log file; following
+// nextCursor continues into older rotated segments.
+export async function readLogs(jobId: string, options: ReadLogsOptions = {}): Promise<LogPage> {
+  const emptyPage: LogPage = { logs: [], nextCursor: null };
+
+  await flushLogs(jobId);
+
+  try {
+    const allFiles = getLogFiles(jobId);
+    let files = allFiles;
+    const limit = Math.min(Math.max(options.limit ?? DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE);
+
+    // Cursors and run ids refer to files by inode, so they stay valid across rotations
+    let before: { ino: number; position: number } | null = null;
+    if (options.before) {
+      before = parsePositionId(options.before);
+      const start = allFiles.findIndex((file) => file.stat.ino === before?.ino);
+      if (!before || start === -1) return emptyPage;
+      files = allFiles.slice(start);
+    }
+
+    // A run never spans two files, so a run filter limits the read to a single file
+    let run: string | undefined;
+    if (options.run) {
+      const runIno = options.run === 'latest' ? allFiles[0]?.stat.ino : parsePositionId(options.run)?.ino;
+      const runFile = files.find((file) => file.stat.ino === runIno);
+      if (!runFile || (before && before.ino !== runIno)) return emptyPage;
+      files = [runFile];
+      run = options.run === 'latest'
+        ? `${runFile.stat.ino}:${updateLogIndex(runFile).runCount}`
+        : options.run;
+    }
+
+    // Collect matching lines, walking backwards through the files from the cursor.
+    // One match past the limit is looked for, so a next cursor is only returned
+    // when an older matching entry really exists.
+    const groups: { file: LogFile; index: LogIndex; lines: number[] }[] = [];
+    let matchCount = 0;
+
+    for (const file of files) {
+      if (matchCount > limit) break;
+
+      const index = updateLogIndex(file);
+      const lineCount = index.offsets.length;
+      const lines: number[] = [];
+      let line = before?.ino === file.stat.ino ? Math.min(before.position, lineCount) - 1 : lineCount - 1;
+
+      for (; line >= 0 && matchCount <= limit; line--) {
+        if (run !== undefined && `${index.ino}:${index.runs[line]}` !== run) continue;
+        if (options.level && index.levels[line] !== options.level) continue;
+        lines.push(line);
+        matchCount++;
+      }
+
+      if (lines.length > 0) {
+        groups.push({ file, index, lines });
+      }
+    }
+
+    const hasMore = matchCount > limit;
+    if (hasMore) {
+      groups[groups.length - 1].lines.pop();
+    }
+
+    const logs: LogEntry[] = [];
+    for (const { file, index, lines } of groups) {
+      if (lines.length === 0) continue;
+
+      const lineEnd = (line: number) =>
+        line + 1 < index.offsets.length ? index.offsets[line + 1] : index.size;
+
+      // Lines are newest first, so the page spans from the last line's start to the first line's end
+      const rangeStart = index.offsets[lines[lines.length - 1]];
+      const rangeEnd = lineEnd(lines[0]);
+
+      const fd = fs.openSync(file.path, 'r');
+      try {
+        const readLine = (line: number, range: Buffer | null): string => {
+          const start = index.offsets[line];
+          const end = lineEnd(line);
+          if (range) {
+            return range.toString('utf8', start - rangeStart, end - rangeStart);
+          }
+          const buffer = Buffer.alloc(end - start);
+          fs.readSync(fd, buffer, 0, buffer.length, start);
+          return buffer.toString('utf8');
+        };
+
+        // Read the whole span at once, unless filtering left the matches spread far apart
+        let range: Buffer | null = null;
+        if (rangeEnd - rangeStart <= MAX_RANGE_READ_SIZE) {
+          range = Buffer.alloc(rangeEnd - rangeStart);
+          fs.readSync(fd, range, 0, range.length, rangeStart);
+        }
+
+        for (const line of lines) {
+          logs.push({
+            ...parseLogLine(readLine(line, range).trim()),
+            id: `${index.ino}:${line}`,
+            run: `${index.ino}:${index.runs[line]}`,
+          });
+        }
+      } finally {
+        fs.closeSync(fd);
+      }
+    }
+
+    return {
+      logs,
+      nextCursor: hasMore && logs.length > 0 ? logs[logs.length - 1].id : null,
+    };
   } catch (error) {
     console.error(`Error reading logs for job ${jobId}:`, error);
-    return [];
+    return emptyPage;
   }
-} 
\ No newline at end of file
+}
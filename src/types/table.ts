@@ -2,11 +2,12 @@ export type TableColumn = {
   column_name: string;
   data_type: string;
   is_nullable: string;
+  sortable: boolean;
 }
 
 export type TableInfo = {
   schema: string;
   table: string;
   columns: TableColumn[];
-  data: Record<string, string | number | boolean | null>[];
+  estimatedRows: number | null;
 }